@@ -8,11 +8,16 @@
 
 """Invenio Administration core admin module."""
 
+from functools import lru_cache
+
 from flask import Blueprint
-from flask_menu import current_menu
 from werkzeug.utils import import_string
 
-from invenio_administration.menu import AdminMenu
+
+@lru_cache(maxsize=None)
+def _load_admin_dashboard(dashboard_config):
+    """Load the dashboard view class from its dotted path, caching the result."""
+    return import_string(dashboard_config)
 
 
 class Administration:
@@ -25,6 +30,8 @@ class Administration:
         url=None,
         ui_endpoint=None,
         base_template=None,
+        static_folder=None,
+        template_folder="templates",
     ):
         """Constructor.
 
@@ -37,38 +44,36 @@ class Administration:
                      or to provide custom endpoint
         :param base_template: base admin template.
                      Defaults to "admin/base.html"
+        :param static_folder: blueprint static folder. Defaults to ``None``,
+                     so that no static files route is registered
+        :param template_folder: blueprint template folder
         """
         super().__init__()
 
         self.app = app
         self._views = []
-        self._menu = AdminMenu()
+        # created by the first ``add_view`` call
+        self._menu = None
         self._menu_key = "admin_navigation"
 
         if name is None:
             name = "Administration"
         self.name = name
 
-        self.dashboard_view_class = self.load_admin_dashboard(app)
+        self.dashboard_view_class = _load_admin_dashboard(
+            app.config["ADMINISTRATION_DASHBOARD_VIEW"]
+        )
         self.endpoint = ui_endpoint or "administration"
         self.url = url or "/administration"
         self.base_template = base_template or "invenio_administration/base.html"
+        self.static_folder = static_folder
+        self.template_folder = template_folder
 
         self.create_blueprint()
 
         if self.dashboard_view_class is not None:
             self._add_dashboard_view()
 
-        @app.before_first_request
-        def init_menu():
-            self._menu.register_menu_entries(current_menu, self._menu_key)
-
-    def load_admin_dashboard(self, app):
-        """Load dashboard view configuration."""
-        dashboard_config = app.config["ADMINISTRATION_DASHBOARD_VIEW"]
-        dashboard_class = import_string(dashboard_config)
-        return dashboard_class
-
     def create_blueprint(self):
         """Create Flask blueprint."""
         # Create blueprint and register rules
@@ -76,26 +81,70 @@ class Administration:
             self.endpoint,
             __name__,
             url_prefix=self.url,
-            template_folder="templates",
-            static_folder="static",
+            template_folder=self.template_folder,
+            static_folder=self.static_folder,
         )
+        self.blueprint.before_request(self._register_menu)
+
+    def _register_menu(self):
+        """Register the pending menu entries on the next admin request.
+
+        The admin menu is only rendered by admin views, so the registration
+        is bound to the admin blueprint instead of every application request.
+        """
+        if self._menu is not None and self._menu.has_pending_items:
+            from flask_menu import current_menu
+
+            self._menu.register_menu_entries(current_menu, self._menu_key)
+
+    def add_view(self, view, view_instance=None, url=None, menu_item=None):
+        """Add a view to admin views.
+
+        :param view: view function, as returned by ``as_view``
+        :param view_instance: view instance, used to get the URL and the
+                     menu entry when they are not provided
+        :param url: URL of the view
+        :param menu_item: menu entry of the view
+        :raises ValueError: if neither ``view_instance`` nor both ``url`` and
+                     ``menu_item`` are given
+        """
+        if view_instance is None and (url is None or menu_item is None):
+            raise ValueError(
+                "Cannot add administration view without a view instance "
+                "or both a URL and a menu item."
+            )
+
+        if self._menu is None:
+            from invenio_administration.menu import AdminMenu
+
+            self._menu = AdminMenu()
 
-    def add_view(self, view, view_instance, *args, **kwargs):
-        """Add a view to admin views."""
         self._views.append(view)
 
-        self.blueprint.add_url_rule(view_instance.url, view_func=view)
-        self._menu.add_view_to_menu(view_instance)
+        self.blueprint.add_url_rule(url or view_instance.url, view_func=view)
+        if menu_item is None:
+            self._menu.add_view_to_menu(view_instance)
+        else:
+            self._menu.add_menu_item(menu_item)
 
     def _add_dashboard_view(self):
         """Add the admin dashboard view."""
-        dashboard_instance = self.dashboard_view_class(
-            admin=self, extension="invenio-administration"
-        )
-        dashboard_view = self.dashboard_view_class.as_view(
-            self.dashboard_view_class.name,
+        from invenio_administration.menu import MenuItem
+
+        view_class = self.dashboard_view_class
+        # the configured dashboard may not subclass AdminDashboardView
+        view_class.is_dashboard = True
+        dashboard_view = view_class.as_view(
+            view_class.name,
             admin=self,
             extension="invenio-administration",
         )
+        endpoint = view_class.endpoint or view_class.name.lower()
+        menu_item = MenuItem(
+            name=view_class.name,
+            endpoint=f"{self.endpoint}.{endpoint}",
+            category=view_class.category,
+        )
 
-        self.add_view(dashboard_view, dashboard_instance)
+        # the dashboard is always served at the admin root
+        self.add_view(dashboard_view, url="/", menu_item=menu_item)
@@ -8,6 +8,8 @@
 
 """Invenio admin extension."""
 
+from threading import Lock
+
 import importlib_metadata
 
 from . import config
@@ -23,6 +25,8 @@ class InvenioAdministration:
 
         self.administration = None
         self._views = []
+        self._pending_resources = []
+        self._pending_resources_lock = Lock()
         if app:
             self.init_app(app)
 
@@ -34,6 +38,7 @@ class InvenioAdministration:
             name=app.config["ADMINISTRATION_APPNAME"],
             base_template=app.config["ADMINISTRATION_BASE_TEMPLATE"],
         )
+        self.administration.blueprint.before_request(self._set_pending_resources)
         if self.entry_point_group:
             self.load_entry_point_group(app)
         app.extensions["invenio-administration"] = self
@@ -65,18 +70,31 @@ class InvenioAdministration:
             **kwargs
         )
         self._views.append(view_class)
-        self.administration.add_view(view, view_instance, *args, **kwargs)
-        self.register_resource(app, view_class, extension_name)
+        self.administration.add_view(view, view_instance)
+        self.register_resource(view_class, extension_name)
 
-    def register_resource(self, app, view_class, extension_name):
-        """Set views schema."""
+    def register_resource(self, view_class, extension_name):
+        """Set views resource and schema.
 
-        @app.before_first_request
-        def register_view_resource():
-            if view_class.resource_config:
+        The resource is provided by another extension, which might not be
+        initialized yet, so it is set on the next admin request.
+        """
+        # only resource views have a resource config
+        if getattr(view_class, "resource_config", None):
+            self._pending_resources.append((view_class, extension_name))
+
+    def _set_pending_resources(self):
+        """Set the resource and schema of the registered views."""
+        if not self._pending_resources:
+            return
+
+        # concurrent requests wait for the resources to be set
+        with self._pending_resources_lock:
+            while self._pending_resources:
+                view_class, extension_name = self._pending_resources[0]
                 view_class.set_resource(extension=extension_name)
-            if view_class.schema:
-                view_class.set_schema(extension=extension_name)
+                view_class.set_schema()
+                self._pending_resources.pop(0)
 
     @staticmethod
     def _normalize_entry_point_name(entry_point_name):
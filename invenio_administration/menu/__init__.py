@@ -8,6 +8,6 @@
 
 """Invenio administration menu module."""
 
-from .menu import AdminMenu
+from .menu import AdminMenu, MenuItem
 
-__all__ = ["AdminMenu"]
+__all__ = ["AdminMenu", "MenuItem"]
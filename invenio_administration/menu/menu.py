@@ -17,17 +17,27 @@ class AdminMenu:
     def __init__(self):
         """Constructor."""
         self._menu_items = []
+        # items not yet registered to the flask menu
+        self._pending_items = []
 
     @property
     def items(self):
         """Return all raw menu items."""
         return self._menu_items
 
+    @property
+    def has_pending_items(self):
+        """Return whether some items are not registered yet."""
+        return bool(self._pending_items)
+
     def register_menu_entries(self, flask_menu_instance, menu_key="admin_navigation"):
-        """Register all menu items to a flask menu instance."""
+        """Register the pending menu items to a flask menu instance.
+
+        All the items added since the last call are registered in a single pass.
+        """
         main_menu = flask_menu_instance.submenu(menu_key)
 
-        for menu_entry in self._menu_items:
+        for menu_entry in self._pending_items:
             category = menu_entry.category
             name = menu_entry.name
             endpoint = menu_entry.endpoint
@@ -51,8 +61,18 @@ class AdminMenu:
                     active_when=active_when or self.default_active_when,
                 )
 
+        self._pending_items = []
+
     def add_menu_item(self, item, index=None):
-        """Add menu item."""
+        """Add menu item.
+
+        :param item: menu item to add
+        :param index: index of an existing item to replace. Flask-Menu entries
+                     cannot be unregistered, so replacing an item that is
+                     already registered only updates its entry if both items
+                     have the same name and category, otherwise the previous
+                     entry is kept.
+        """
         menu_item = isinstance(item, MenuItem)
         error_message = "item should be MenuItem instance"
 
@@ -60,10 +80,15 @@ class AdminMenu:
             return TypeError(error_message)
 
         if index:
+            replaced_item = self._menu_items[index]
             self._menu_items[index] = item
-            return
+            # an item replaced before being registered never reaches the menu
+            if replaced_item in self._pending_items:
+                self._pending_items.remove(replaced_item)
+        else:
+            self._menu_items.append(item)
 
-        self._menu_items.append(item)
+        self._pending_items.append(item)
 
     def add_view_to_menu(self, view, index=None):
         """Add menu item from view."""
@@ -7,15 +7,14 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Invenio Administration views base module."""
-from functools import partial
+import sys
+from functools import lru_cache, partial
+from types import MappingProxyType
 
 from flask import current_app, render_template
 from flask.views import MethodView
-from flask_security import roles_required
-from invenio_search_ui.searchconfig import search_app_config
 
 from invenio_administration.errors import InvalidResource
-from invenio_administration.marshmallow_utils import jsonify_schema
 
 # class AdminViewType(MethodViewType):
 #     """Metaclass for :class:`AdminView`."""
@@ -26,9 +25,36 @@ from invenio_administration.marshmallow_utils import jsonify_schema
 #             cls._extension = d["extension"]
 #
 
+_DEFAULT_SEARCH_HEADERS = MappingProxyType(
+    {"Accept": "application/vnd.inveniordm.v1+json"}
+)
+"""Read-only search request headers shared by all list views."""
+
+
+@lru_cache(maxsize=None)
+def _admin_decorators():
+    """Build the decorators shared by all admin views."""
+    from flask_security import roles_required
+
+    return (roles_required("admin"),)
+
+
+class _AdminDecorators:
+    """Descriptor resolving the default admin decorators on first access."""
+
+    def __get__(self, instance, owner):
+        """Return the shared admin decorators."""
+        return _admin_decorators()
+
 
 class AdminBaseView(MethodView):
-    """Base view for admin views."""
+    """Base view for admin views.
+
+    ``decorators`` defaults to ``(roles_required("admin"),)``. The tuple is
+    built on first access, to import ``flask_security`` only when a view is
+    actually created, and extended by subclasses with e.g.
+    ``decorators = AdminBaseView.decorators + (my_decorator,)``.
+    """
 
     _extension = None
     name = None
@@ -36,8 +62,9 @@ class AdminBaseView(MethodView):
     endpoint = None
     template = "invenio_administration/index.html"
     url = None
+    is_dashboard = False
 
-    decorators = [roles_required("admin")]
+    decorators = _AdminDecorators()
 
     def __init__(
         self,
@@ -99,7 +126,7 @@ class AdminBaseView(MethodView):
     def _get_view_url(self, url):
         """Generate URL for the view. Override to change default behavior."""
         if url is None:
-            if isinstance(self, self.administration.dashboard_view_class):
+            if self.is_dashboard:
                 url = "/"
             else:
                 url = "/%s" % self.endpoint
@@ -109,13 +136,10 @@ class AdminBaseView(MethodView):
 
         return url
 
-    def _get_template(self):
-        return self.template
-
     def render(self, **kwargs):
         """Render template."""
         kwargs["admin_base_template"] = self.administration.base_template
-        return render_template(self._get_template(), **kwargs)
+        return render_template(self.template, **kwargs)
 
     def get(self):
         """GET view method."""
@@ -179,7 +203,10 @@ class AdminResourceBaseView(AdminBaseView):
         # when the actual class needed
         return cls.resource.service.schema.schema()
 
-    def _schema_to_json(self, schema):
+    @staticmethod
+    def _schema_to_json(schema):
+        from invenio_administration.marshmallow_utils import jsonify_schema
+
         return jsonify_schema(schema)
 
     def serialize_actions(self):
@@ -207,14 +234,33 @@ class AdminResourceDetailView(AdminResourceBaseView):
     item_field_exclude_list = None
     item_field_list = None
     template = "invenio_administration/details.html"
+    _schema_json = None
+
+    @classmethod
+    def set_schema(cls):
+        """Set schema."""
+        super().set_schema()
+        # the JSON schema built so far belongs to a previous application
+        cls._schema_json = None
+
+    @classmethod
+    def _get_schema_json(cls):
+        """Get the JSON representation of the schema.
+
+        It is built on the first request and stored on the view class, so
+        that a schema which cannot be converted only fails its own view.
+        """
+        # look up the class' own attribute, not one inherited from a parent view
+        schema_json = vars(cls).get("_schema_json")
+        if schema_json is None:
+            schema_json = cls._schema_to_json(cls.schema)
+            cls._schema_json = schema_json
+        return schema_json
 
     def get(self, pid_value=None):
         """GET view method."""
-        schema = self._get_service_schema()
-        serialize_schema = self._schema_to_json(schema)
-
         # TODO context processor?
-        return self.render(**{"schema": serialize_schema})
+        return self.render(**{"schema": self._get_schema_json()})
 
 
 class AdminResourceListView(AdminResourceBaseView):
@@ -234,8 +280,17 @@ class AdminResourceListView(AdminResourceBaseView):
     columns = None
     template = "invenio_administration/search.html"
     search_api_endpoint = None
+    _search_config = None
+
+    # overrides should also be wrapped in a ``MappingProxyType``
+    search_request_headers = _DEFAULT_SEARCH_HEADERS
 
-    search_request_headers = {"Accept": "application/vnd.inveniordm.v1+json"}
+    @classmethod
+    def set_resource(cls, extension=None):
+        """Set resource."""
+        super().set_resource(extension)
+        # the search config built so far belongs to a previous application
+        cls._search_config = None
 
     def get_search_request_headers(self):
         """Get search request headers."""
@@ -244,15 +299,21 @@ class AdminResourceListView(AdminResourceBaseView):
     def get_search_app_name(self):
         """Get search app name."""
         if self.search_config_name is None:
-            return f"{self.name.upper()}_SEARCH"
+            # interned, the name is used as an app config key
+            return sys.intern(f"{self.name.upper()}_SEARCH")
         return self.search_config_name
 
     def get_search_api_endpoint(self):
-        """Get search API endpoint."""
-        blueprint_name = f"{self.resource.config.blueprint_name}.search"
+        """Get search API endpoint.
+
+        Only called when building the search config, which is stored on the
+        view class.
+        """
         if self.search_api_endpoint:
             return self.search_api_endpoint
 
+        blueprint_name = sys.intern(f"{self.resource.config.blueprint_name}.search")
+
         # TODO improve fetching of the api endpoint
         blueprint_rule = (
             current_app.wsgi_app.app.mounts["/api"]
@@ -264,15 +325,29 @@ class AdminResourceListView(AdminResourceBaseView):
         return api_endpoint
 
     def init_search_config(self):
-        """Build search view config."""
-        return partial(
-            search_app_config,
-            config_name=self.get_search_app_name(),
-            available_facets=current_app.config[self.search_facets_config_name],
-            sort_options=current_app.config[self.search_sort_config_name],
-            endpoint=self.get_search_api_endpoint(),
-            headers=self.get_search_request_headers(),
-        )
+        """Build search view config.
+
+        The config does not change at runtime, so it is built on the first
+        request and stored on the view class until ``set_resource`` runs for
+        another application.
+        """
+        cls = type(self)
+        # look up the class' own attribute, not one inherited from a parent view
+        search_config = vars(cls).get("_search_config")
+        if search_config is None:
+            from invenio_search_ui.searchconfig import search_app_config
+
+            search_config = partial(
+                search_app_config,
+                config_name=self.get_search_app_name(),
+                available_facets=current_app.config[self.search_facets_config_name],
+                sort_options=current_app.config[self.search_sort_config_name],
+                endpoint=self.get_search_api_endpoint(),
+                # plain dict copy, the config is serialized to JSON
+                headers=dict(self.get_search_request_headers()),
+            )
+            cls._search_config = search_config
+        return search_config
 
     def get_sort_options(self):
         """Get search sort options."""
@@ -289,11 +364,10 @@ class AdminResourceListView(AdminResourceBaseView):
     def get(self):
         """GET view method."""
         search_conf = self.init_search_config()
-        schema = self._get_service_schema()
         return self.render(
             **{
                 "search_config": search_conf,
-                "resource_schema": schema,
+                "resource_schema": self.schema,
                 "columns": self.columns,
             }
         )
@@ -325,11 +399,3 @@ class AdminResourceViewSet:
 
     list_view = None
     details_view = None
-
-    def list_view(self):
-        """List view."""
-        pass
-
-    def details_view(self):
-        """Details view."""
-        pass
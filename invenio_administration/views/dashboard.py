@@ -17,3 +17,4 @@ class AdminDashboardView(AdminBaseView):
     template = "invenio_administration/index.html"
     name = "dashboard"
     url = "/"
+    is_dashboard = True
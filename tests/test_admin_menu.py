@@ -8,6 +8,11 @@
 
 """Invenio Administration menu test module."""
 
+import pytest
+from flask import Flask
+from flask_menu import Menu
+
+from invenio_administration.menu import AdminMenu, MenuItem
 from invenio_administration.views.dashboard import AdminDashboardView
 
 
@@ -59,3 +64,32 @@ def test_menu_generation(
         expected_url = f"/administration/"
         # check if url from endpoint matches expected url
         assert menu_entry.url == expected_url
+
+
+def test_menu_pending_items():
+    app = Flask("testapp")
+    Menu(app)
+    flask_menu = app.extensions["menu"]
+
+    menu = AdminMenu()
+    menu.add_menu_item(MenuItem(name="first", endpoint="administration.first"))
+    menu.add_menu_item(MenuItem(name="second", endpoint="administration.second"))
+    # replaced before registration, "second" is never registered
+    menu.add_menu_item(MenuItem(name="third", endpoint="administration.third"), 1)
+    assert menu.has_pending_items
+
+    menu.register_menu_entries(flask_menu)
+    # registered items are kept but not registered again
+    assert not menu.has_pending_items
+    assert [item.name for item in menu.items] == ["first", "third"]
+    children = flask_menu.submenu("admin_navigation").children
+    assert sorted(child.name for child in children) == ["first", "third"]
+
+
+def test_menu_replace_out_of_range():
+    menu = AdminMenu()
+    with pytest.raises(IndexError):
+        menu.add_menu_item(MenuItem(name="first", endpoint="administration.first"), 1)
+    # the failed replacement is not registered later
+    assert not menu.items
+    assert not menu.has_pending_items
@@ -1,5 +1,109 @@
-from invenio_administration.views.base import AdminBaseView
+from types import SimpleNamespace
+
+from flask import Flask
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from invenio_administration.views.base import (
+    AdminBaseView,
+    AdminResourceDetailView,
+    AdminResourceListView,
+)
 
 
 class TestCustomView(AdminBaseView):
     pass
+
+
+def test_default_decorators():
+    decorators = AdminBaseView.decorators
+    assert isinstance(decorators, tuple)
+    assert len(decorators) == 1
+    # shared by subclasses and extendable without mutating the default
+    assert TestCustomView.decorators is decorators
+    assert len(decorators + (lambda f: f,)) == 2
+
+
+class MockListView(AdminResourceListView):
+    name = "mock-list"
+    resource_config = "mock_resource"
+    search_facets_config_name = "MOCK_FACETS"
+    search_sort_config_name = "MOCK_SORT"
+
+
+def create_list_view_app(facets, api_rule):
+    """Create an app providing the resource and the API of MockListView."""
+    app = Flask("testapp")
+    app.config.update(MOCK_FACETS=facets, MOCK_SORT={})
+    app.extensions["administration-test"] = SimpleNamespace(
+        mock_resource=SimpleNamespace(config=SimpleNamespace(blueprint_name="mock"))
+    )
+    api_app = Flask("testapi")
+    api_app.add_url_rule(api_rule, endpoint="mock.search")
+    # same layout as the invenio-app WSGI factory
+    app.wsgi_app = ProxyFix(DispatcherMiddleware(app.wsgi_app, {"/api": api_app}))
+    return app
+
+
+def test_search_api_endpoint_per_app():
+    for api_rule in ("/records-a", "/records-b"):
+        app = create_list_view_app({}, api_rule)
+        with app.app_context():
+            MockListView.set_resource(extension="administration-test")
+            view = MockListView(extension="administration-test")
+            assert view.get_search_api_endpoint().endswith(api_rule)
+
+
+def test_search_config_per_app():
+    for facets in ("A", "B"):
+        app = create_list_view_app(facets, "/records")
+        with app.app_context():
+            MockListView.set_resource(extension="administration-test")
+            view = MockListView(extension="administration-test")
+            search_config = view.init_search_config()
+            assert search_config.keywords["available_facets"] == facets
+            # built once per class for a given application
+            assert view.init_search_config() is search_config
+
+
+class MockSchema:
+    """Service schema of the mock resource."""
+
+
+class MockDetailView(AdminResourceDetailView):
+    name = "mock-detail"
+    resource_config = "mock_resource"
+    conversions = 0
+
+    @staticmethod
+    def _schema_to_json(schema):
+        MockDetailView.conversions += 1
+        return {"schema": type(schema).__name__}
+
+    def render(self, **kwargs):
+        return kwargs
+
+
+def test_detail_view_schema_json():
+    app = Flask("testapp")
+    app.extensions["administration-test"] = SimpleNamespace(
+        mock_resource=SimpleNamespace(
+            service=SimpleNamespace(schema=SimpleNamespace(schema=MockSchema))
+        )
+    )
+    with app.app_context():
+        MockDetailView.set_resource(extension="administration-test")
+        MockDetailView.set_schema()
+    # the JSON schema is only built by the detail view itself
+    assert MockDetailView.conversions == 0
+
+    view = MockDetailView(extension="administration-test")
+    assert view.get() == {"schema": {"schema": "MockSchema"}}
+    assert view.get() == {"schema": {"schema": "MockSchema"}}
+    assert MockDetailView.conversions == 1
+
+    # set again for a new application
+    with app.app_context():
+        MockDetailView.set_schema()
+    view.get()
+    assert MockDetailView.conversions == 2
@@ -8,9 +8,17 @@
 
 """Module tests."""
 
+from types import SimpleNamespace
+
+import pytest
 from flask import Flask
 
 from invenio_administration import InvenioAdministration
+from invenio_administration.views.base import (
+    AdminBaseView,
+    AdminResourceBaseView,
+    AdminResourceDetailView,
+)
 
 
 def test_version():
@@ -31,3 +39,117 @@ def test_init():
     assert "invenio-administration" not in app.extensions
     ext.init_app(app)
     assert "invenio-administration" in app.extensions
+
+
+def test_blueprint_without_static_folder():
+    """Test that no static files route is registered by default."""
+    app = Flask("testapp")
+    ext = InvenioAdministration(app)
+    assert ext.administration.blueprint.static_folder is None
+    assert "administration.static" not in app.view_functions
+
+
+def test_dashboard_view(create_app):
+    """Test the dashboard URL rule and menu entry."""
+    app = create_app()
+    administration = app.extensions["invenio-administration"].administration
+    dashboard_name = administration.dashboard_view_class.name
+
+    rules = [
+        rule for rule in app.url_map.iter_rules() if rule.rule == "/administration/"
+    ]
+    assert len(rules) == 1
+    assert rules[0].endpoint == f"administration.{dashboard_name}"
+
+    menu_entry = administration._menu.items[0]
+    assert menu_entry.name == dashboard_name
+    assert menu_entry.endpoint == rules[0].endpoint
+
+
+class MockSchema:
+    """Service schema of the mock resource."""
+
+
+class MockResourceView(AdminResourceBaseView):
+    name = "mock-resource"
+    resource_config = "mock_resource"
+    set_resource_calls = 0
+
+    @classmethod
+    def set_resource(cls, extension=None):
+        """Count the calls."""
+        cls.set_resource_calls += 1
+        super().set_resource(extension)
+
+
+class MockView(AdminBaseView):
+    name = "mock-view"
+
+
+def test_register_resource(create_app):
+    """Test that resources are set on the first admin request."""
+    app = create_app()
+    resource = SimpleNamespace(
+        service=SimpleNamespace(schema=SimpleNamespace(schema=MockSchema))
+    )
+    app.extensions["administration-test"] = SimpleNamespace(mock_resource=resource)
+    ext = app.extensions["invenio-administration"]
+
+    # views without a resource config are skipped
+    ext.register_view(MockView, "administration-test", app)
+    assert not ext._pending_resources
+
+    ext.register_view(MockResourceView, "administration-test", app)
+    assert MockResourceView.resource is None
+    assert MockResourceView.schema is None
+
+    with app.test_request_context("/administration/"):
+        app.preprocess_request()
+    assert MockResourceView.resource is resource
+    assert isinstance(MockResourceView.schema, MockSchema)
+    assert MockResourceView.set_resource_calls == 1
+
+    # later requests do not set the resource again
+    with app.test_request_context("/administration/"):
+        app.preprocess_request()
+    assert MockResourceView.set_resource_calls == 1
+
+
+class FailingDetailView(AdminResourceDetailView):
+    name = "failing-detail"
+    resource_config = "mock_resource"
+
+    @staticmethod
+    def _schema_to_json(schema):
+        raise Exception("Unrecognised schema field")
+
+
+def test_register_detail_view_resource(create_app):
+    """Test that the JSON schema is not built by the resource registration."""
+    app = create_app()
+    resource = SimpleNamespace(
+        service=SimpleNamespace(schema=SimpleNamespace(schema=MockSchema))
+    )
+    app.extensions["administration-test"] = SimpleNamespace(mock_resource=resource)
+    ext = app.extensions["invenio-administration"]
+    ext.register_view(FailingDetailView, "administration-test", app)
+
+    for _ in range(2):
+        with app.test_request_context("/administration/"):
+            app.preprocess_request()
+    assert not ext._pending_resources
+    assert isinstance(FailingDetailView.schema, MockSchema)
+
+
+def test_add_view_arguments(create_app):
+    """Test that a view needs an instance or both a URL and a menu item."""
+    app = create_app()
+    administration = app.extensions["invenio-administration"].administration
+    menu_items = list(administration._menu.items)
+
+    with pytest.raises(ValueError):
+        administration.add_view(lambda: "")
+    with pytest.raises(ValueError):
+        administration.add_view(lambda: "", url="/test")
+    # nothing was added by the rejected calls
+    assert administration._menu.items == menu_items